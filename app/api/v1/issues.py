@@ -204,5 +204,5 @@ async def get_issue_transitions(
 
     return IssueStatusTransition(
         current_status=issue.status,
-        valid_transitions=issue.get_valid_transitions(),
+        valid_transitions=list(issue.get_valid_transitions()),
     )
@@ -36,16 +36,16 @@ class Permission(str, Enum):
 
 
 # Role to permission mapping
-ROLE_PERMISSIONS: dict[UserRole, set[Permission]] = {
-    UserRole.DEVELOPER: {
+ROLE_PERMISSIONS: dict[UserRole, frozenset[Permission]] = {
+    UserRole.DEVELOPER: frozenset({
         Permission.VIEW_PROJECTS,
         Permission.VIEW_ISSUES,
         Permission.CREATE_ISSUE,
         Permission.VIEW_COMMENTS,
         Permission.ADD_COMMENT,
         Permission.VIEW_USERS,
-    },
-    UserRole.MANAGER: {
+    }),
+    UserRole.MANAGER: frozenset({
         Permission.VIEW_PROJECTS,
         Permission.CREATE_PROJECT,
         Permission.EDIT_PROJECT,
@@ -58,8 +58,8 @@ ROLE_PERMISSIONS: dict[UserRole, set[Permission]] = {
         Permission.ADD_COMMENT,
         Permission.EDIT_COMMENT,
         Permission.VIEW_USERS,
-    },
-    UserRole.ADMIN: set(Permission),  # All permissions
+    }),
+    UserRole.ADMIN: frozenset(Permission),  # All permissions
 }
 
 
@@ -77,7 +77,7 @@ def has_permission(user: User, permission: Permission) -> bool:
     if not user or not user.is_active:
         return False
 
-    user_permissions = ROLE_PERMISSIONS.get(user.role, set())
+    user_permissions = ROLE_PERMISSIONS.get(user.role, frozenset())
     return permission in user_permissions
 
 
@@ -109,7 +109,7 @@ def has_all_permissions(user: User, permissions: list[Permission]) -> bool:
     return all(has_permission(user, p) for p in permissions)
 
 
-def get_user_permissions(user: User) -> set[Permission]:
+def get_user_permissions(user: User) -> frozenset[Permission]:
     """
     Get all permissions for a user.
 
@@ -120,9 +120,9 @@ def get_user_permissions(user: User) -> set[Permission]:
         Set of permissions the user has
     """
     if not user or not user.is_active:
-        return set()
+        return frozenset()
 
-    return ROLE_PERMISSIONS.get(user.role, set())
+    return ROLE_PERMISSIONS.get(user.role, frozenset())
 
 
 class PermissionChecker:
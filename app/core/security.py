@@ -13,13 +13,23 @@ from app.config import settings
 from app.models.user import UserRole
 
 # Initialize Argon2 password hasher with secure defaults
-password_hasher = PasswordHasher(
-    time_cost=3,  # Number of iterations
-    memory_cost=65536,  # 64 MB
-    parallelism=4,  # Number of parallel threads
-    hash_len=32,  # Length of the hash in bytes
-    salt_len=16,  # Length of the salt in bytes
-)
+if settings.is_testing:
+    # Minimal cost so test suites exercise the same code path without the KDF delay
+    password_hasher = PasswordHasher(
+        time_cost=1,
+        memory_cost=8,  # 8 KB (Argon2 minimum for parallelism=1)
+        parallelism=1,
+        hash_len=16,
+        salt_len=8,
+    )
+else:
+    password_hasher = PasswordHasher(
+        time_cost=3,  # Number of iterations
+        memory_cost=65536,  # 64 MB
+        parallelism=4,  # Number of parallel threads
+        hash_len=32,  # Length of the hash in bytes
+        salt_len=16,  # Length of the salt in bytes
+    )
 
 
 def hash_password(password: str) -> str:
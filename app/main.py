@@ -1,9 +1,10 @@
 """Main FastAPI application entry point."""
 
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
-from fastapi import FastAPI, Request, status
+import redis.asyncio as redis
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -19,7 +20,7 @@ from app.middleware.audit_logger import AuditLogMiddleware
 from app.middleware.rate_limiter import RateLimitMiddleware
 from app.middleware.request_id import RequestIDMiddleware
 from app.middleware.security_headers import SecurityHeadersMiddleware
-from app.redis import close_redis, init_redis
+from app.redis import close_redis, get_redis, init_redis
 from app.schemas.common import HealthResponse
 
 
@@ -70,7 +71,9 @@ class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
 
 # Add middleware (order matters - first added is outermost)
 app.add_middleware(RequestIDMiddleware)
-app.add_middleware(AuditLogMiddleware)
+if not settings.is_testing:
+    # Per-request audit logging is only noise (and stdout I/O) under test
+    app.add_middleware(AuditLogMiddleware)
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(RateLimitMiddleware)
 app.add_middleware(RequestSizeLimitMiddleware)
@@ -193,11 +196,12 @@ async def health_check() -> HealthResponse:
     tags=["Health"],
     summary="Readiness probe",
 )
-async def readiness_check() -> HealthResponse:
+async def readiness_check(
+    redis_client: Optional[redis.Redis] = Depends(get_redis),
+) -> HealthResponse:
     """Readiness probe - checks database and Redis connectivity."""
     from sqlalchemy import text
     from app.database import async_session_maker
-    from app.redis import get_redis
 
     db_status = "healthy"
     redis_status = "healthy"
@@ -211,7 +215,6 @@ async def readiness_check() -> HealthResponse:
 
     # Check Redis
     try:
-        redis_client = await get_redis()
         await redis_client.ping()
     except Exception as e:
         redis_status = f"unhealthy: {str(e)}"
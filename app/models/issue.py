@@ -37,16 +37,16 @@ class IssuePriority(str, enum.Enum):
 
 
 # Valid status transitions (state machine)
-VALID_STATUS_TRANSITIONS: dict[IssueStatus, list[IssueStatus]] = {
-    IssueStatus.OPEN: [IssueStatus.IN_PROGRESS, IssueStatus.CLOSED],
-    IssueStatus.IN_PROGRESS: [IssueStatus.RESOLVED, IssueStatus.OPEN],
-    IssueStatus.RESOLVED: [IssueStatus.CLOSED, IssueStatus.REOPENED],
-    IssueStatus.CLOSED: [IssueStatus.REOPENED],
-    IssueStatus.REOPENED: [
+VALID_STATUS_TRANSITIONS: dict[IssueStatus, tuple[IssueStatus, ...]] = {
+    IssueStatus.OPEN: (IssueStatus.IN_PROGRESS, IssueStatus.CLOSED),
+    IssueStatus.IN_PROGRESS: (IssueStatus.RESOLVED, IssueStatus.OPEN),
+    IssueStatus.RESOLVED: (IssueStatus.CLOSED, IssueStatus.REOPENED),
+    IssueStatus.CLOSED: (IssueStatus.REOPENED,),
+    IssueStatus.REOPENED: (
         IssueStatus.IN_PROGRESS,
         IssueStatus.RESOLVED,
         IssueStatus.CLOSED,
-    ],
+    ),
 }
 
 
@@ -168,7 +168,7 @@ class Issue(Base):
     @property
     def is_critical(self) -> bool:
         """Check if the issue is critical priority."""
-        return self.priority == IssuePriority.CRITICAL
+        return self.priority is IssuePriority.CRITICAL
 
     @property
     def is_open(self) -> bool:
@@ -182,8 +182,8 @@ class Issue(Base):
 
     def can_transition_to(self, new_status: IssueStatus) -> bool:
         """Check if transition to new status is valid."""
-        return new_status in VALID_STATUS_TRANSITIONS.get(self.status, [])
+        return new_status in VALID_STATUS_TRANSITIONS.get(self.status, ())
 
-    def get_valid_transitions(self) -> list[IssueStatus]:
-        """Get list of valid status transitions from current status."""
-        return VALID_STATUS_TRANSITIONS.get(self.status, [])
+    def get_valid_transitions(self) -> tuple[IssueStatus, ...]:
+        """Get valid status transitions from current status."""
+        return VALID_STATUS_TRANSITIONS.get(self.status, ())
@@ -121,12 +121,12 @@ class User(Base):
     @property
     def is_admin(self) -> bool:
         """Check if user is an admin."""
-        return self.role == UserRole.ADMIN
+        return self.role is UserRole.ADMIN
 
     @property
     def is_manager(self) -> bool:
         """Check if user is a manager or admin."""
-        return self.role in (UserRole.MANAGER, UserRole.ADMIN)
+        return self.role is UserRole.MANAGER or self.role is UserRole.ADMIN
 
     @property
     def is_locked(self) -> bool:
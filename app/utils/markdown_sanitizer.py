@@ -1,6 +1,10 @@
 """Markdown sanitization utilities to prevent XSS attacks."""
 
-import bleach
+import re
+import threading
+
+import nh3
+from bleach.linkifier import Linker
 
 # Allowed HTML tags for markdown content
 ALLOWED_TAGS = [
@@ -39,6 +43,24 @@ ALLOWED_ATTRIBUTES = {
 # Allowed protocols for href/src attributes
 ALLOWED_PROTOCOLS = ["http", "https", "mailto"]
 
+# Characters the sanitizers escape, drop or normalize (markup, entities, controls)
+HTML_SPECIAL_CHARS = re.compile(r"[\x00-\x08\x0b-\x1f\xa0\ufeff&<>]")
+
+# Sanitizer for markdown content; "rel" is an allowed attribute that
+# _add_noopener sets, so nh3 must not insert its own
+MARKDOWN_CLEANER = nh3.Cleaner(
+    tags=set(ALLOWED_TAGS),
+    attributes={tag: set(attrs) for tag, attrs in ALLOWED_ATTRIBUTES.items()},
+    url_schemes=set(ALLOWED_PROTOCOLS),
+    link_rel=None,
+)
+
+# Sanitizer that removes every tag
+STRIP_ALL_CLEANER = nh3.Cleaner(tags=set())
+
+# Per-thread bleach linker, see _get_linker()
+_linkers = threading.local()
+
 
 def sanitize_markdown(content: str) -> str:
     """
@@ -53,23 +75,17 @@ def sanitize_markdown(content: str) -> str:
     if not content:
         return content
 
-    # Use bleach to clean the content
-    cleaned = bleach.clean(
-        content,
-        tags=ALLOWED_TAGS,
-        attributes=ALLOWED_ATTRIBUTES,
-        protocols=ALLOWED_PROTOCOLS,
-        strip=True,
-    )
+    linker = _get_linker()
 
-    # Add rel="noopener noreferrer" to links for security
-    cleaned = bleach.linkify(
-        cleaned,
-        callbacks=[_add_noopener],
-        skip_tags=["pre", "code"],
-    )
+    # Plain text with nothing to escape or linkify comes back unchanged
+    if not (HTML_SPECIAL_CHARS.search(content) or linker.url_re.search(content)):
+        return content
 
-    return cleaned
+    # Use nh3 to clean the content
+    cleaned = MARKDOWN_CLEANER.clean(content)
+
+    # Add rel="noopener noreferrer" to links for security
+    return linker.linkify(cleaned)
 
 
 def _add_noopener(attrs: dict, new: bool = False) -> dict:
@@ -90,6 +106,24 @@ def _add_noopener(attrs: dict, new: bool = False) -> dict:
     return attrs
 
 
+def _get_linker() -> Linker:
+    """
+    Get this thread's bleach linker, building it on first use.
+
+    bleach keeps parser state on the linker, so it is reused per thread
+    rather than shared or rebuilt on every call.
+
+    Returns:
+        Linker that adds rel="noopener noreferrer" to links
+    """
+    if not hasattr(_linkers, "linker"):
+        _linkers.linker = Linker(
+            callbacks=[_add_noopener],
+            skip_tags=["pre", "code"],
+        )
+    return _linkers.linker
+
+
 def strip_all_html(content: str) -> str:
     """
     Remove all HTML tags from content.
@@ -103,7 +137,7 @@ def strip_all_html(content: str) -> str:
     if not content:
         return content
 
-    return bleach.clean(content, tags=[], strip=True)
+    return STRIP_ALL_CLEANER.clean(content)
 
 
 def escape_html(content: str) -> str:
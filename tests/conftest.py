@@ -1,26 +1,43 @@
 """Pytest configuration and fixtures."""
 
 import os
-from unittest.mock import AsyncMock, MagicMock
 
 # Set test environment variables BEFORE any app imports
 # Don't set JWT_PRIVATE_KEY - let it fall back to HS256 with SECRET_KEY
 os.environ["APP_ENV"] = "testing"
 os.environ["DEBUG"] = "true"
 os.environ["SECRET_KEY"] = "test-secret-key-for-testing-only-not-for-production"
-# Use in-memory SQLite for tests - fastest option
-os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///:memory:"
+# Use in-memory SQLite for tests - fastest option. The shared-cache URI lets
+# every connection in this process (including the app's own engine) see one DB;
+# naming it per xdist worker keeps parallel workers from ever sharing state.
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+TEST_DATABASE_URL = (
+    f"sqlite+aiosqlite:///file:test_db_{_XDIST_WORKER}"
+    "?mode=memory&cache=shared&uri=true"
+)
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL
 # Disable Redis for tests
 os.environ["REDIS_URL"] = ""
 
 # Now safe to import
-from typing import AsyncGenerator
-from uuid import uuid4
+from typing import AsyncGenerator, Awaitable, Callable, Generator, NamedTuple
+from uuid import UUID
 
+import fakeredis
 import pytest
 import pytest_asyncio
-from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from fakeredis.aioredis import FakeRedis
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient, Response
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.pool import StaticPool
 
 # Now import app modules (after env vars are set)
 from app.database import Base, get_db
@@ -29,7 +46,28 @@ from app.models.project import Project
 from app.models.issue import Issue, IssuePriority, IssueStatus
 from app.models.comment import Comment
 from app.core.security import hash_password, create_access_token
-from app.main import app
+from app.redis import get_redis
+
+# Pay one-off mapper configuration and argon2 native-module loading at import,
+# not inside whichever test happens to run first
+configure_mappers()
+hash_password("warmup")
+
+# Fixed session ID for test tokens; no endpoint test inspects it
+TEST_SESSION_ID = "00000000-0000-0000-0000-00000000a001"
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run async tests in the session-wide loop and tag unit vs integration tests."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+        # Only tests that talk to the app pull in the database, Redis and client
+        if "client" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.integration)
+        else:
+            item.add_marker(pytest.mark.unit)
 
 
 def auth_header(token: str) -> dict:
@@ -37,207 +75,284 @@ def auth_header(token: str) -> dict:
     return {"Authorization": f"Bearer {token}"}
 
 
-@pytest.fixture(autouse=True)
-def mock_redis(monkeypatch):
-    """Mock Redis for all tests."""
-    mock_redis_client = MagicMock()
-    mock_redis_client.get = AsyncMock(return_value=None)
-    mock_redis_client.set = AsyncMock(return_value=True)
-    mock_redis_client.setex = AsyncMock(return_value=True)
-    mock_redis_client.delete = AsyncMock(return_value=True)
-    mock_redis_client.exists = AsyncMock(return_value=0)
-    mock_redis_client.incr = AsyncMock(return_value=1)
-    mock_redis_client.expire = AsyncMock(return_value=True)
-    mock_redis_client.ttl = AsyncMock(return_value=-2)
-    mock_redis_client.ping = AsyncMock(return_value=True)
-    mock_redis_client.close = AsyncMock()
-    
-    # Mock the get_redis function
-    async def mock_get_redis():
-        return mock_redis_client
-    
-    try:
-        from app.core import redis as redis_module
-        monkeypatch.setattr(redis_module, "get_redis", mock_get_redis)
-        monkeypatch.setattr(redis_module, "redis_client", mock_redis_client)
-    except (ImportError, AttributeError):
-        pass  # Redis module might not exist or have different structure
-    
-    return mock_redis_client
+def assert_paginated_ok(response: Response, min_total: int = 0) -> dict:
+    """Assert a successful paginated list response and return its body."""
+    assert response.status_code == 200
+    data = response.json()
+    assert {"items", "total", "page", "limit"} <= data.keys()
+    assert data["total"] >= min_total
+    return data
 
 
-@pytest_asyncio.fixture
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Create a fresh in-memory database for each test."""
-    # Create new engine for each test (in-memory DB is isolated)
-    engine = create_async_engine(
-        "sqlite+aiosqlite:///:memory:",
+@pytest.fixture(scope="session")
+def fastapi_app() -> FastAPI:
+    """Import the application on first use and prime its OpenAPI schema."""
+    from app.main import app
+
+    app.openapi()
+    return app
+
+
+@pytest.fixture(scope="session")
+def fake_redis_server() -> fakeredis.FakeServer:
+    """In-process Redis server shared by the whole test session."""
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture(scope="session")
+def fake_redis(fake_redis_server: fakeredis.FakeServer) -> FakeRedis:
+    """Async Redis client bound to the session-wide fake server."""
+    return FakeRedis(server=fake_redis_server, decode_responses=True)
+
+
+@pytest.fixture
+def mock_redis(
+    fastapi_app: FastAPI,
+    fake_redis_server: fakeredis.FakeServer,
+    fake_redis: FakeRedis,
+) -> Generator[FakeRedis, None, None]:
+    """Serve the fake Redis to the app, starting every test from an empty store."""
+    fakeredis.FakeStrictRedis(server=fake_redis_server).flushall()
+
+    async def override_get_redis():
+        return fake_redis
+
+    fastapi_app.dependency_overrides[get_redis] = override_get_redis
+    yield fake_redis
+    fastapi_app.dependency_overrides.pop(get_redis, None)
+
+
+def _enable_sqlite_savepoints(engine: AsyncEngine) -> None:
+    """Let SQLAlchemy drive SQLite transactions so SAVEPOINTs nest correctly."""
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+@pytest_asyncio.fixture(scope="session")
+async def engine() -> AsyncGenerator[AsyncEngine, None]:
+    """Create the in-memory test database once per session."""
+    test_engine = create_async_engine(
+        TEST_DATABASE_URL,
         echo=False,
+        poolclass=StaticPool,
+        connect_args={"uri": True},
     )
-    
-    # Create all tables
-    async with engine.begin() as conn:
+    _enable_sqlite_savepoints(test_engine)
+
+    async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    
-    # Create session
-    async_session_factory = async_sessionmaker(
-        engine,
+
+    yield test_engine
+
+    await test_engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Session factory whose commits only release a SAVEPOINT."""
+    return async_sessionmaker(
         class_=AsyncSession,
         expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
     )
 
-    async with async_session_factory() as session:
-        yield session
-    
-    # Cleanup
-    await engine.dispose()
+
+@pytest_asyncio.fixture
+async def db_session(
+    engine: AsyncEngine,
+    async_session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncGenerator[AsyncSession, None]:
+    """Run each test inside an outer transaction that is rolled back afterwards."""
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        async with async_session_factory(bind=conn) as session:
+            yield session
+        await transaction.rollback()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def _client(fastapi_app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
+    """Create the HTTP client once; ASGITransport never runs app lifespan."""
+    transport = ASGITransport(app=fastapi_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
 
 
 @pytest_asyncio.fixture
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    """Create a test client with the test database."""
+async def client(
+    fastapi_app: FastAPI,
+    _client: AsyncClient,
+    db_session: AsyncSession,
+    mock_redis: FakeRedis,
+) -> AsyncGenerator[AsyncClient, None]:
+    """Point the shared test client at this test's database session."""
 
     async def override_get_db():
         yield db_session
 
-    app.dependency_overrides[get_db] = override_get_db
+    fastapi_app.dependency_overrides[get_db] = override_get_db
+    yield _client
+    fastapi_app.dependency_overrides.pop(get_db, None)
+
+
+# Fixed primary keys for fixture rows; tests keep uuid4() for ad-hoc data
+TEST_USER_IDS: dict[UserRole, UUID] = {
+    UserRole.DEVELOPER: UUID("00000000-0000-0000-0000-000000000001"),
+    UserRole.ADMIN: UUID("00000000-0000-0000-0000-000000000002"),
+    UserRole.MANAGER: UUID("00000000-0000-0000-0000-000000000003"),
+}
+TEST_PROJECT_ID = UUID("00000000-0000-0000-0000-000000000101")
+TEST_ISSUE_ID = UUID("00000000-0000-0000-0000-000000000201")
+TEST_COMMENT_ID = UUID("00000000-0000-0000-0000-000000000301")
+
+# (username, email, password) for the fixture user of each role
+TEST_USERS: dict[UserRole, tuple[str, str, str]] = {
+    UserRole.DEVELOPER: ("testuser", "test@example.com", "TestPassword123!"),
+    UserRole.ADMIN: ("adminuser", "admin@example.com", "AdminPassword123!"),
+    UserRole.MANAGER: ("manageruser", "manager@example.com", "ManagerPassword123!"),
+}
+
+
+@pytest_asyncio.fixture(scope="session")
+async def seed_session(
+    engine: AsyncEngine,
+    async_session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncGenerator[AsyncSession, None]:
+    """Session for rows shared by the whole test session; its commits persist."""
+    async with async_session_factory(bind=engine) as session:
+        yield session
 
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
 
-    app.dependency_overrides.clear()
+@pytest.fixture(scope="session")
+def user_factory(
+    seed_session: AsyncSession,
+) -> Callable[[UserRole], Awaitable[User]]:
+    """Return a coroutine that creates the fixture user for a role."""
 
+    async def create_user(role: UserRole) -> User:
+        username, email, password = TEST_USERS[role]
+        user = User(
+            id=TEST_USER_IDS[role],
+            username=username,
+            email=email,
+            password_hash=hash_password(password),
+            role=role,
+            is_active=True,
+        )
+        seed_session.add(user)
+        await seed_session.commit()
+        return user
 
-@pytest_asyncio.fixture
-async def test_user(db_session: AsyncSession) -> User:
+    return create_user
+
+
+@pytest_asyncio.fixture(scope="session")
+async def test_user(user_factory: Callable[[UserRole], Awaitable[User]]) -> User:
     """Create a test user."""
-    user = User(
-        id=uuid4(),
-        username="testuser",
-        email="test@example.com",
-        password_hash=hash_password("TestPassword123!"),
-        role=UserRole.DEVELOPER,
-        is_active=True,
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-    return user
+    return await user_factory(UserRole.DEVELOPER)
 
 
-@pytest_asyncio.fixture
-async def admin_user(db_session: AsyncSession) -> User:
+@pytest_asyncio.fixture(scope="session")
+async def admin_user(user_factory: Callable[[UserRole], Awaitable[User]]) -> User:
     """Create an admin user."""
-    user = User(
-        id=uuid4(),
-        username="adminuser",
-        email="admin@example.com",
-        password_hash=hash_password("AdminPassword123!"),
-        role=UserRole.ADMIN,
-        is_active=True,
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-    return user
+    return await user_factory(UserRole.ADMIN)
 
 
-@pytest_asyncio.fixture
-async def manager_user(db_session: AsyncSession) -> User:
+@pytest_asyncio.fixture(scope="session")
+async def manager_user(user_factory: Callable[[UserRole], Awaitable[User]]) -> User:
     """Create a manager user."""
-    user = User(
-        id=uuid4(),
-        username="manageruser",
-        email="manager@example.com",
-        password_hash=hash_password("ManagerPassword123!"),
-        role=UserRole.MANAGER,
-        is_active=True,
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-    return user
+    return await user_factory(UserRole.MANAGER)
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def user_token(test_user: User) -> str:
-    """Create a JWT token for the test user."""
+    """Create a JWT token for the test user, shared by the whole session."""
     return create_access_token(
         user_id=str(test_user.id),
         role=test_user.role,
-        session_id=str(uuid4()),
+        session_id=TEST_SESSION_ID,
     )
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def admin_token(admin_user: User) -> str:
-    """Create a JWT token for the admin user."""
+    """Create a JWT token for the admin user, shared by the whole session."""
     return create_access_token(
         user_id=str(admin_user.id),
         role=admin_user.role,
-        session_id=str(uuid4()),
+        session_id=TEST_SESSION_ID,
     )
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def manager_token(manager_user: User) -> str:
-    """Create a JWT token for the manager user."""
+    """Create a JWT token for the manager user, shared by the whole session."""
     return create_access_token(
         user_id=str(manager_user.id),
         role=manager_user.role,
-        session_id=str(uuid4()),
+        session_id=TEST_SESSION_ID,
     )
 
 
-@pytest_asyncio.fixture
-async def test_project(db_session: AsyncSession, admin_user: User) -> Project:
-    """Create a test project."""
+class SeededData(NamedTuple):
+    """Project, issue and comment created together by the seeded fixture."""
+
+    project: Project
+    issue: Issue
+    comment: Comment
+
+
+@pytest_asyncio.fixture(scope="session")
+async def seeded(
+    seed_session: AsyncSession, admin_user: User, test_user: User
+) -> SeededData:
+    """Create a project, issue and comment once, in a single flush."""
     project = Project(
-        id=uuid4(),
+        id=TEST_PROJECT_ID,
         name="Test Project",
         description="A test project for testing purposes",
         created_by_id=admin_user.id,
         is_archived=False,
     )
-    db_session.add(project)
-    await db_session.commit()
-    await db_session.refresh(project)
-    return project
-
-
-@pytest_asyncio.fixture
-async def test_issue(
-    db_session: AsyncSession, test_project: Project, test_user: User
-) -> Issue:
-    """Create a test issue."""
     issue = Issue(
-        id=uuid4(),
+        id=TEST_ISSUE_ID,
         title="Test Issue",
         description="A test issue for testing purposes",
         status=IssueStatus.OPEN,
         priority=IssuePriority.MEDIUM,
-        project_id=test_project.id,
+        project_id=project.id,
         reporter_id=test_user.id,
     )
-    db_session.add(issue)
-    await db_session.commit()
-    await db_session.refresh(issue)
-    return issue
-
-
-@pytest_asyncio.fixture
-async def test_comment(
-    db_session: AsyncSession, test_issue: Issue, test_user: User
-) -> Comment:
-    """Create a test comment."""
     comment = Comment(
-        id=uuid4(),
+        id=TEST_COMMENT_ID,
         content="Test comment content",
-        issue_id=test_issue.id,
+        issue_id=issue.id,
         author_id=test_user.id,
     )
-    db_session.add(comment)
-    await db_session.commit()
-    await db_session.refresh(comment)
-    return comment
+    seed_session.add_all([project, issue, comment])
+    await seed_session.commit()
+    return SeededData(project=project, issue=issue, comment=comment)
+
+
+@pytest.fixture(scope="session")
+def test_project(seeded: SeededData) -> Project:
+    """The shared test project."""
+    return seeded.project
+
+
+@pytest.fixture(scope="session")
+def test_issue(seeded: SeededData) -> Issue:
+    """The shared test issue, in the test project."""
+    return seeded.issue
+
+
+@pytest.fixture(scope="session")
+def test_comment(seeded: SeededData) -> Comment:
+    """The shared test comment, on the test issue."""
+    return seeded.comment
@@ -3,7 +3,13 @@
 import pytest
 from httpx import AsyncClient
 
+from app.models.user import User, UserRole
+from tests.conftest import TEST_USERS, auth_header
 
+TEST_PASSWORD = TEST_USERS[UserRole.DEVELOPER][2]
+
+
+@pytest.mark.cpu
 @pytest.mark.asyncio
 async def test_register_user(client: AsyncClient):
     """Test user registration."""
@@ -50,25 +56,15 @@ async def test_register_user_weak_password(client: AsyncClient):
     assert response.status_code == 422
 
 
+@pytest.mark.cpu
 @pytest.mark.asyncio
-async def test_login_success(client: AsyncClient):
+async def test_login_success(client: AsyncClient, test_user: User):
     """Test successful login."""
-    # First register a user
-    await client.post(
-        "/api/auth/register",
-        json={
-            "username": "loginuser",
-            "email": "loginuser@example.com",
-            "password": "SecurePassword123!",
-        },
-    )
-
-    # Then login
     response = await client.post(
         "/api/auth/login",
         json={
-            "username": "loginuser",
-            "password": "SecurePassword123!",
+            "username": test_user.username,
+            "password": TEST_PASSWORD,
         },
     )
     assert response.status_code == 200
@@ -98,43 +94,33 @@ async def test_get_me_unauthorized(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_get_me_authenticated(client: AsyncClient):
+async def test_get_me_authenticated(
+    client: AsyncClient, test_user: User, user_token: str
+):
     """Test getting current user with authentication."""
-    # Register and get token
-    register_response = await client.post(
-        "/api/auth/register",
-        json={
-            "username": "meuser",
-            "email": "meuser@example.com",
-            "password": "SecurePassword123!",
-        },
-    )
-    token = register_response.json()["access_token"]
-
-    # Get current user
     response = await client.get(
         "/api/auth/me",
-        headers={"Authorization": f"Bearer {token}"},
+        headers=auth_header(user_token),
     )
     assert response.status_code == 200
     data = response.json()
-    assert data["username"] == "meuser"
-    assert data["email"] == "meuser@example.com"
+    assert data["username"] == test_user.username
+    assert data["email"] == test_user.email
 
 
+@pytest.mark.cpu
 @pytest.mark.asyncio
-async def test_refresh_token(client: AsyncClient):
+async def test_refresh_token(client: AsyncClient, test_user: User):
     """Test token refresh."""
-    # Register and get tokens
-    register_response = await client.post(
-        "/api/auth/register",
+    # Log in to get tokens
+    login_response = await client.post(
+        "/api/auth/login",
         json={
-            "username": "refreshuser",
-            "email": "refreshuser@example.com",
-            "password": "SecurePassword123!",
+            "username": test_user.username,
+            "password": TEST_PASSWORD,
         },
     )
-    refresh_token = register_response.json()["refresh_token"]
+    refresh_token = login_response.json()["refresh_token"]
 
     # Refresh token
     response = await client.post(
@@ -3,12 +3,14 @@
 import uuid
 
 import pytest
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
 from httpx import AsyncClient
 
 from app.models.comment import Comment
 from app.models.issue import Issue
 from app.models.user import User
-from tests.conftest import auth_header
+from tests.conftest import SeededData, auth_header
 
 
 class TestListComments:
@@ -134,11 +136,11 @@ class TestUpdateComment:
 
     @pytest.mark.asyncio
     async def test_update_comment_success(
-        self, client: AsyncClient, test_comment: Comment, user_token: str
+        self, client: AsyncClient, seeded: SeededData, user_token: str
     ):
         """Test updating a comment by author."""
         response = await client.patch(
-            f"/api/comments/{test_comment.id}",
+            f"/api/comments/{seeded.comment.id}",
             headers=auth_header(user_token),
             json={"content": "Updated comment content"},
         )
@@ -149,11 +151,11 @@ class TestUpdateComment:
 
     @pytest.mark.asyncio
     async def test_update_comment_not_author(
-        self, client: AsyncClient, test_comment: Comment, manager_token: str
+        self, client: AsyncClient, seeded: SeededData, manager_token: str
     ):
         """Test updating a comment by non-author (unauthorized)."""
         response = await client.patch(
-            f"/api/comments/{test_comment.id}",
+            f"/api/comments/{seeded.comment.id}",
             headers=auth_header(manager_token),
             json={"content": "Unauthorized update"},
         )
@@ -166,11 +168,11 @@ class TestUpdateComment:
 
     @pytest.mark.asyncio
     async def test_update_comment_admin_can_modify(
-        self, client: AsyncClient, test_comment: Comment, admin_token: str
+        self, client: AsyncClient, seeded: SeededData, admin_token: str
     ):
         """Test that admin can update any comment."""
         response = await client.patch(
-            f"/api/comments/{test_comment.id}",
+            f"/api/comments/{seeded.comment.id}",
             headers=auth_header(admin_token),
             json={"content": "Admin updated content"},
         )
@@ -195,27 +197,27 @@ class TestUpdateComment:
 class TestCommentAuditTrail:
     """Tests for comment audit trail (no delete)."""
 
-    @pytest.mark.asyncio
-    async def test_no_delete_endpoint(
-        self, client: AsyncClient, test_comment: Comment, user_token: str
-    ):
+    def test_no_delete_endpoint(self, fastapi_app: FastAPI):
         """Test that there's no delete endpoint for comments."""
-        response = await client.delete(
-            f"/api/comments/{test_comment.id}",
-            headers=auth_header(user_token),
-        )
+        comment_routes = [
+            route
+            for route in fastapi_app.routes
+            if isinstance(route, APIRoute)
+            and route.path == "/api/comments/{comment_id}"
+        ]
 
-        # Should return 405 Method Not Allowed or 404 Not Found
-        assert response.status_code in [404, 405]
+        # The comment route exists for edits but never accepts DELETE
+        assert any("PATCH" in route.methods for route in comment_routes)
+        assert not any("DELETE" in route.methods for route in comment_routes)
 
     @pytest.mark.asyncio
     async def test_comment_is_edited_flag(
-        self, client: AsyncClient, test_comment: Comment, user_token: str
+        self, client: AsyncClient, seeded: SeededData, user_token: str
     ):
         """Test that is_edited flag is set after update."""
         # Update the comment
         await client.patch(
-            f"/api/comments/{test_comment.id}",
+            f"/api/comments/{seeded.comment.id}",
             headers=auth_header(user_token),
             json={"content": "Edited content"},
         )
@@ -224,7 +226,7 @@ class TestCommentAuditTrail:
         # Note: The is_edited flag depends on the time difference
         # This test may need adjustment based on implementation
         response = await client.get(
-            f"/api/issues/{test_comment.issue_id}/comments",
+            f"/api/issues/{seeded.comment.issue_id}/comments",
             headers=auth_header(user_token),
         )
 
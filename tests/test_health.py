@@ -31,3 +31,13 @@ async def test_root_endpoint(client: AsyncClient):
     data = response.json()
     assert "name" in data
     assert "version" in data
+
+
+@pytest.mark.asyncio
+async def test_readiness_probe(client: AsyncClient):
+    """Test the readiness probe reports database and Redis status."""
+    response = await client.get("/health/ready")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["database"] == "healthy"
+    assert data["redis"] == "healthy"
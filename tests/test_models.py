@@ -11,65 +11,67 @@ from app.models.issue import IssueStatus, IssuePriority
 class TestUserModel:
     """Tests for User model."""
 
-    def test_user_role_values(self):
+    @pytest.mark.parametrize(
+        ("role", "value"),
+        [
+            (UserRole.ADMIN, "admin"),
+            (UserRole.MANAGER, "manager"),
+            (UserRole.DEVELOPER, "developer"),
+        ],
+    )
+    def test_user_role_values(self, role: UserRole, value: str):
         """Test that user roles have correct values."""
-        assert UserRole.ADMIN.value == "admin"
-        assert UserRole.MANAGER.value == "manager"
-        assert UserRole.DEVELOPER.value == "developer"
+        assert role.value == value
 
-    def test_user_is_admin(self):
-        """Test is_admin property."""
-        admin = User(
+    @pytest.mark.parametrize(
+        ("role", "is_admin", "is_manager"),
+        [
+            (UserRole.ADMIN, True, True),
+            (UserRole.MANAGER, False, True),
+            (UserRole.DEVELOPER, False, False),
+        ],
+    )
+    def test_user_role_properties(
+        self, role: UserRole, is_admin: bool, is_manager: bool
+    ):
+        """Test is_admin and is_manager properties for each role."""
+        user = User(
             id=uuid4(),
-            username="admin",
-            email="admin@example.com",
+            username=role.value,
+            email=f"{role.value}@example.com",
             password_hash="hash",
-            role=UserRole.ADMIN,
+            role=role,
         )
-        developer = User(
-            id=uuid4(),
-            username="dev",
-            email="dev@example.com",
-            password_hash="hash",
-            role=UserRole.DEVELOPER,
-        )
-        assert admin.is_admin is True
-        assert developer.is_admin is False
-
-    def test_user_is_manager(self):
-        """Test is_manager property."""
-        manager = User(
-            id=uuid4(),
-            username="manager",
-            email="manager@example.com",
-            password_hash="hash",
-            role=UserRole.MANAGER,
-        )
-        developer = User(
-            id=uuid4(),
-            username="dev",
-            email="dev@example.com",
-            password_hash="hash",
-            role=UserRole.DEVELOPER,
-        )
-        assert manager.is_manager is True
-        assert developer.is_manager is False
+        assert user.is_admin is is_admin
+        assert user.is_manager is is_manager
 
 
 class TestIssueEnums:
     """Tests for Issue enums."""
 
-    def test_issue_status_values(self):
+    @pytest.mark.parametrize(
+        ("status", "value"),
+        [
+            (IssueStatus.OPEN, "open"),
+            (IssueStatus.IN_PROGRESS, "in_progress"),
+            (IssueStatus.RESOLVED, "resolved"),
+            (IssueStatus.CLOSED, "closed"),
+            (IssueStatus.REOPENED, "reopened"),
+        ],
+    )
+    def test_issue_status_values(self, status: IssueStatus, value: str):
         """Test that issue statuses have correct values."""
-        assert IssueStatus.OPEN.value == "open"
-        assert IssueStatus.IN_PROGRESS.value == "in_progress"
-        assert IssueStatus.RESOLVED.value == "resolved"
-        assert IssueStatus.CLOSED.value == "closed"
-        assert IssueStatus.REOPENED.value == "reopened"
+        assert status.value == value
 
-    def test_issue_priority_values(self):
+    @pytest.mark.parametrize(
+        ("priority", "value"),
+        [
+            (IssuePriority.LOW, "low"),
+            (IssuePriority.MEDIUM, "medium"),
+            (IssuePriority.HIGH, "high"),
+            (IssuePriority.CRITICAL, "critical"),
+        ],
+    )
+    def test_issue_priority_values(self, priority: IssuePriority, value: str):
         """Test that issue priorities have correct values."""
-        assert IssuePriority.LOW.value == "low"
-        assert IssuePriority.MEDIUM.value == "medium"
-        assert IssuePriority.HIGH.value == "high"
-        assert IssuePriority.CRITICAL.value == "critical"
+        assert priority.value == value
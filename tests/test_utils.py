@@ -1,7 +1,6 @@
 """Tests for utility functions."""
 
 import pytest
-from uuid import uuid4
 
 from app.utils.validators import (
     validate_uuid,
@@ -18,48 +17,57 @@ from app.utils.markdown_sanitizer import sanitize_markdown
 class TestUuidValidator:
     """Tests for UUID validation."""
 
-    def test_valid_uuid(self):
-        """Test that valid UUIDs pass validation."""
-        valid_uuid = str(uuid4())
-        result = validate_uuid(valid_uuid)
-        assert result is not None
-
-    def test_invalid_uuid(self):
-        """Test that invalid UUIDs fail validation."""
-        assert validate_uuid("not-a-uuid") is None
-        assert validate_uuid("12345") is None
-        assert validate_uuid("") is None
+    @pytest.mark.parametrize(
+        ("value", "valid"),
+        [
+            ("12345678-1234-5678-1234-567812345678", True),
+            ("not-a-uuid", False),
+            ("12345", False),
+            ("", False),
+        ],
+    )
+    def test_validate_uuid(self, value: str, valid: bool):
+        """Test that only valid UUIDs parse."""
+        assert (validate_uuid(value) is not None) is valid
 
 
 class TestPathTraversalValidator:
     """Tests for path traversal detection."""
 
-    def test_safe_path(self):
-        """Test that safe paths pass validation."""
-        assert validate_path_traversal("normal/path/file.txt") is True
-        assert validate_path_traversal("file.txt") is True
-
-    def test_path_traversal_detected(self):
-        """Test that path traversal is detected."""
-        assert validate_path_traversal("../etc/passwd") is False
-        assert validate_path_traversal("..\\windows\\system32") is False
-        assert validate_path_traversal("path/../../file") is False
+    @pytest.mark.parametrize(
+        ("path", "safe"),
+        [
+            ("normal/path/file.txt", True),
+            ("file.txt", True),
+            ("../etc/passwd", False),
+            ("..\\windows\\system32", False),
+            ("path/../../file", False),
+            ("%2e%2e/etc/passwd", False),
+            ("file.txt\x00.jpg", False),
+        ],
+    )
+    def test_validate_path_traversal(self, path: str, safe: bool):
+        """Test that path traversal patterns are detected."""
+        assert validate_path_traversal(path) is safe
 
 
 class TestContentTypeValidator:
     """Tests for content type validation."""
 
-    def test_valid_content_type(self):
-        """Test valid content types."""
+    @pytest.mark.parametrize(
+        ("content_type", "valid"),
+        [
+            ("application/json", True),
+            ("application/json; charset=utf-8", True),
+            ("text/plain", True),
+            ("text/html", False),
+            (None, False),
+        ],
+    )
+    def test_validate_content_type(self, content_type: str | None, valid: bool):
+        """Test content types against an allow-list."""
         allowed = ["application/json", "text/plain"]
-        assert validate_content_type("application/json", allowed) is True
-        assert validate_content_type("application/json; charset=utf-8", allowed) is True
-
-    def test_invalid_content_type(self):
-        """Test invalid content types."""
-        allowed = ["application/json"]
-        assert validate_content_type("text/html", allowed) is False
-        assert validate_content_type(None, allowed) is False
+        assert validate_content_type(content_type, allowed) is valid
 
 
 class TestQueryParamsValidator:
@@ -77,50 +85,66 @@ class TestQueryParamsValidator:
 class TestFilenameSanitizer:
     """Tests for filename sanitization."""
 
-    def test_safe_filename(self):
-        """Test that safe filenames are preserved."""
-        assert sanitize_filename("document.pdf") == "document.pdf"
-        assert sanitize_filename("my_file-1.txt") == "my_file-1.txt"
-
-    def test_dangerous_filename(self):
-        """Test that dangerous filenames are sanitized."""
-        assert "/" not in sanitize_filename("../etc/passwd")
-        assert "\\" not in sanitize_filename("..\\windows\\system32")
-
-    def test_empty_filename(self):
-        """Test empty filename handling."""
-        assert sanitize_filename("") == ""
-        assert sanitize_filename("..") == "unnamed"
+    @pytest.mark.parametrize(
+        ("filename", "expected"),
+        [
+            ("document.pdf", "document.pdf"),
+            ("my_file-1.txt", "my_file-1.txt"),
+            ("", ""),
+            ("..", "unnamed"),
+        ],
+    )
+    def test_sanitize_filename(self, filename: str, expected: str):
+        """Test that safe filenames are preserved and empty ones handled."""
+        assert sanitize_filename(filename) == expected
+
+    @pytest.mark.parametrize("filename", ["../etc/passwd", "..\\windows\\system32"])
+    def test_dangerous_filename(self, filename: str):
+        """Test that path separators are removed from dangerous filenames."""
+        result = sanitize_filename(filename)
+        assert "/" not in result
+        assert "\\" not in result
 
 
 class TestEmailValidator:
     """Tests for email validation."""
 
-    def test_valid_email(self):
-        """Test valid email addresses."""
-        assert is_valid_email("user@example.com") is True
-        assert is_valid_email("test.user@domain.org") is True
-
-    def test_invalid_email(self):
-        """Test invalid email addresses."""
-        assert is_valid_email("not-an-email") is False
-        assert is_valid_email("@example.com") is False
-        assert is_valid_email("user@") is False
-        assert is_valid_email("") is False
+    @pytest.mark.parametrize(
+        ("email", "valid"),
+        [
+            ("user@example.com", True),
+            ("test.user@domain.org", True),
+            ("not-an-email", False),
+            ("@example.com", False),
+            ("user@", False),
+            ("", False),
+            ("user@" + "a." * 120 + "1", False),
+            ("a" * 64 + "@example.com", True),
+            ("a" * 65 + "@example.com", False),
+            ("user@" + "a" * 250 + ".com", False),
+            ("user@example." + "a" * 25, False),
+        ],
+    )
+    def test_is_valid_email(self, email: str, valid: bool):
+        """Test email address validation."""
+        assert is_valid_email(email) is valid
 
 
 class TestUrlValidator:
     """Tests for URL safety validation."""
 
-    def test_safe_url(self):
-        """Test safe URLs."""
-        assert is_safe_url("https://example.com") is True
-        assert is_safe_url("/relative/path") is True
-
-    def test_unsafe_url(self):
-        """Test unsafe URLs."""
-        assert is_safe_url("javascript:alert(1)") is False
-        assert is_safe_url("") is False
+    @pytest.mark.parametrize(
+        ("url", "safe"),
+        [
+            ("https://example.com", True),
+            ("/relative/path", True),
+            ("javascript:alert(1)", False),
+            ("", False),
+        ],
+    )
+    def test_is_safe_url(self, url: str, safe: bool):
+        """Test URL safety for redirection."""
+        assert is_safe_url(url) is safe
 
 
 class TestMarkdownSanitizer:
@@ -160,3 +184,14 @@ class TestMarkdownSanitizer:
         text = "```python\nprint('hello')\n```"
         result = sanitize_markdown(text)
         assert "print" in result
+
+    def test_plain_text_unchanged(self):
+        """Test that text without markup or links is returned as-is."""
+        text = "Steps:\n1. Open the *settings* page\n2. Click 'Save'"
+        assert sanitize_markdown(text) == text
+
+    def test_urls_linkified(self):
+        """Test that bare URLs in plain text still get safe links."""
+        result = sanitize_markdown("See https://example.com for details")
+        assert '<a href="https://example.com"' in result
+        assert 'rel="noopener noreferrer"' in result
@@ -3,6 +3,8 @@
 import pytest
 from httpx import AsyncClient
 
+from tests.conftest import auth_header
+
 
 @pytest.mark.asyncio
 async def test_username_max_length(client: AsyncClient):
@@ -98,51 +100,28 @@ async def test_content_type_validation(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_uuid_format_validation(client: AsyncClient):
+async def test_uuid_format_validation(client: AsyncClient, user_token: str):
     """Test that invalid UUID format is rejected."""
-    # Register to get a token
-    reg_response = await client.post(
-        "/api/auth/register",
-        json={
-            "username": "uuidtest",
-            "email": "uuidtest@example.com",
-            "password": "SecurePassword123!",
-        },
-    )
-    token = reg_response.json()["access_token"]
-
-    # Try to get project with invalid UUID
     response = await client.get(
         "/api/projects/not-a-valid-uuid",
-        headers={"Authorization": f"Bearer {token}"},
+        headers=auth_header(user_token),
     )
     assert response.status_code == 422
 
 
 @pytest.mark.asyncio
-async def test_pagination_limits(client: AsyncClient):
+async def test_pagination_limits(client: AsyncClient, user_token: str):
     """Test pagination parameter limits."""
-    # Register to get a token
-    reg_response = await client.post(
-        "/api/auth/register",
-        json={
-            "username": "paginationtest",
-            "email": "paginationtest@example.com",
-            "password": "SecurePassword123!",
-        },
-    )
-    token = reg_response.json()["access_token"]
-
     # Test limit exceeding max
     response = await client.get(
         "/api/projects?limit=1000",  # Max is usually 100
-        headers={"Authorization": f"Bearer {token}"},
+        headers=auth_header(user_token),
     )
     assert response.status_code == 422
 
     # Test negative page
     response = await client.get(
         "/api/projects?page=-1",
-        headers={"Authorization": f"Bearer {token}"},
+        headers=auth_header(user_token),
     )
     assert response.status_code == 422